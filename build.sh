@@ -96,9 +96,11 @@ EOF
 clean_build() {
     echo -e "${YELLOW}🧹 Performing clean build...${NC}"
     
-    # Remove all export directories from Godot projects
+    # Remove all export directories from Godot projects in a single walk
+    # (this also removes any temporary .godot directories inside them;
+    # -prune stops find from descending into trees that are being deleted)
     echo -e "${YELLOW}🗑️  Removing all export directories...${NC}"
-    find "$SCRIPT_DIR/godot-demo-projects" -name "exports" -type d -exec rm -rf {} + 2>/dev/null || true
+    find "$SCRIPT_DIR/godot-demo-projects" -name "exports" -type d -prune -exec rm -rf {} + 2>/dev/null || true
     
     # Clean build cache and temporary files
     echo -e "${YELLOW}🧽 Cleaning build cache and temporary files...${NC}"
@@ -106,10 +108,6 @@ clean_build() {
     rm -rf "$BUILD_SYSTEM_DIR/cache" 2>/dev/null || true
     rm -rf "$BUILD_SYSTEM_DIR/build" 2>/dev/null || true
     
-    # Clean any .godot directories from export paths
-    echo -e "${YELLOW}🧼 Cleaning temporary .godot directories...${NC}"
-    find "$SCRIPT_DIR/godot-demo-projects" -name ".godot" -type d -path "*/exports/*" -exec rm -rf {} + 2>/dev/null || true
-    
     echo -e "${GREEN}✅ Clean completed!${NC}"
 }
 
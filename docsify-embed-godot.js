@@ -266,10 +266,11 @@
 
   function addMobileTouchSupport(iframe) {
     var doubleTapTimeout;
-    var lastTap = 0;
+    var lastTap = -Infinity;
     
     iframe.addEventListener('touchend', function(e) {
-      var currentTime = new Date().getTime();
+      // Monotonic clock: immune to system clock changes and no Date allocation
+      var currentTime = performance.now();
       var tapLength = currentTime - lastTap;
       
       if (tapLength < 500 && tapLength > 0) {
@@ -285,6 +286,15 @@
   // State management
   const processedMarkers = new Set();
 
+  // Patterns used when resolving embed markers, compiled once at load
+  const MD_EXTENSION_RE = /\.md$/;
+  const SCENE_PATH_RE = /(?:gdEmbed\/)?scenes\/([^\/]+)\/([^\/]+)(?:\/(?:README|index)?)?$/;
+  const PROJECT_PATH_RE = /([^\/]+)\/([^\/]+)\/([^\/]+)(?:\/(?:README|index)?)?$/;
+  const PROJECT_EMBED_RE = /embed-\{([^}]+)\}/;
+  const LEGACY_EMBED_RE = /embed-([a-zA-Z0-9_-]+)(?:\s*:\s*(.+))?/;
+  const LEADING_SLASH_RE = /^\//;
+  const TRAILING_README_RE = /\/(README)?$/;
+
   // Extract current path from window location
   function getCurrentScenePath() {
     var currentHash = window.location.hash.substring(1);
@@ -296,7 +306,7 @@
     }
     
     // Remove .md extension if present
-    currentHash = currentHash.replace(/\.md$/, '');
+    currentHash = currentHash.replace(MD_EXTENSION_RE, '');
     
     // Remove leading slash if present
     if (currentHash.startsWith('/')) {
@@ -313,7 +323,7 @@
     // scenes/category/scene_name/README  
     // gdEmbed/scenes/category/scene_name
     // scenes/category/scene_name
-    var originalPathMatch = currentHash.match(/(?:gdEmbed\/)?scenes\/([^\/]+)\/([^\/]+)(?:\/(?:README|index)?)?$/);
+    var originalPathMatch = currentHash.match(SCENE_PATH_RE);
     
     if (originalPathMatch) {
       var category = originalPathMatch[1];
@@ -327,7 +337,7 @@
     // godot-demo-projects/2d/bullet_shower
     // godot-examples/category/project_name
     // any-repo/category/project_name
-    var generalPathMatch = currentHash.match(/([^\/]+)\/([^\/]+)\/([^\/]+)(?:\/(?:README|index)?)?$/);
+    var generalPathMatch = currentHash.match(PROJECT_PATH_RE);
     
     if (generalPathMatch) {
       var repo = generalPathMatch[1];
@@ -410,6 +420,8 @@
       
       // Determine the demo path based on repository structure
       var currentHash = window.location.hash.substring(1);
+      // Remove leading slash and trailing slash/README (computed once, reused below)
+      var cleanHash = currentHash.replace(LEADING_SLASH_RE, '').replace(TRAILING_README_RE, '');
       var demoPath;
       
       console.log('🔍 Current hash for path determination:', currentHash);
@@ -422,8 +434,6 @@
       // Strategy 2: Individual project structure (like godot-demo-projects)
       else {
         // For individual projects, construct path to the current project's exports
-        // Remove leading slash and trailing slash/README
-        var cleanHash = currentHash.replace(/^\//, '').replace(/\/(README)?$/, '');
         demoPath = `${cleanHash}/exports/web/`;
         console.log('📍 Using individual project strategy');
       }
@@ -435,7 +445,7 @@
       console.log('🔗 Full demo path construction:', {
         baseUrl: baseUrl,
         currentHash: currentHash,
-        cleanHash: currentHash.replace(/^\//, '').replace(/\/(README)?$/, ''),
+        cleanHash: cleanHash,
         demoPath: demoPath,
         fullDemoUrl: fullDemoUrl
       });
@@ -445,7 +455,7 @@
     }
     
     // Parse other marker formats - support the {project_path} format
-    var embedMatch = markerText.match(/embed-\{([^}]+)\}/);
+    var embedMatch = markerText.match(PROJECT_EMBED_RE);
     if (embedMatch) {
       var projectPath = embedMatch[1];
       console.log('🎯 Processing project path embed:', projectPath);
@@ -465,7 +475,7 @@
     }
     
     // Legacy support for other formats
-    var legacyMatch = markerText.match(/embed-([a-zA-Z0-9_-]+)(?:\s*:\s*(.+))?/);
+    var legacyMatch = markerText.match(LEGACY_EMBED_RE);
     if (!legacyMatch) {
       console.warn('Invalid embed format:', markerText);
       insertErrorMessage(marker, `Invalid embed format: ${markerText}`);
@@ -538,11 +548,14 @@
       container.classList.add('demo-project-embed');
     }
     
-    var iframeId = `demo-iframe-${sceneName.replace(/\s+/g, '-')}-${Date.now()}`;
-    var fullscreenBtnId = `fullscreen-btn-${sceneName.replace(/\s+/g, '-')}-${Date.now()}`;
-    var trueFullscreenBtnId = `true-fullscreen-btn-${sceneName.replace(/\s+/g, '-')}-${Date.now()}`;
-    var expandedBtnId = `expanded-btn-${sceneName.replace(/\s+/g, '-')}-${Date.now()}`;
-    var popoutBtnId = `popout-btn-${sceneName.replace(/\s+/g, '-')}-${Date.now()}`;
+    // Shared id suffix: setupDemoControls derives sibling button ids from
+    // fullscreenBtnId, so every id must end with the same slug and timestamp
+    var idSuffix = `${sceneName.replace(/\s+/g, '-')}-${Date.now()}`;
+    var iframeId = `demo-iframe-${idSuffix}`;
+    var fullscreenBtnId = `fullscreen-btn-${idSuffix}`;
+    var trueFullscreenBtnId = `true-fullscreen-btn-${idSuffix}`;
+    var expandedBtnId = `expanded-btn-${idSuffix}`;
+    var popoutBtnId = `popout-btn-${idSuffix}`;
 
     var headerTitle = `🎮 Interactive Demo: ${sceneName}`;
     var instructions = 'Interactive demo';
@@ -603,16 +616,12 @@
     setTimeout(initializeDemoEmbeds, 100);
   }
   
-  // Register Docsify plugin
+  // Register Docsify plugin. doneEach fires after every route render,
+  // including SPA hash navigation, so no separate hashchange timer is needed.
   window.$docsify = window.$docsify || {};
   window.$docsify.plugins = (window.$docsify.plugins || []).concat(function(hook) {
     hook.doneEach(initializePlugin);
   });
   
-  // Monitor hash changes for SPA navigation
-  window.addEventListener('hashchange', () => {
-    setTimeout(initializePlugin, 200);
-  });
-  
   console.log('🎮 Demo embed plugin loaded');
 })();
@@ -148,7 +148,7 @@ check_environment() {
     
     # Check submodules
     if [[ -f "$SCRIPT_DIR/.gitmodules" ]]; then
-        local submodule_status=$(git submodule status 2>/dev/null | grep -c "^-" || true)
+        local submodule_status=$(git -C "$SCRIPT_DIR" submodule status 2>/dev/null | grep -c "^-" || true)
         if [[ "$submodule_status" -eq 0 ]]; then
             log_success "Submodules: Initialized"
         else
@@ -282,7 +282,7 @@ except ImportError as e:
 EOF
     
     # Run the setup
-    if python3 /tmp/setup_godot.py; then
+    if (cd "$SCRIPT_DIR" && python3 /tmp/setup_godot.py); then
         log_success "Godot environment setup completed"
     else
         log_error "Godot environment setup failed"
@@ -298,10 +298,22 @@ setup_submodules() {
     log_step "Setting up submodules..."
     
     if [[ -f "$SCRIPT_DIR/.gitmodules" ]]; then
-        cd "$SCRIPT_DIR"
+        # Initialize and update submodules, fetching them in parallel with
+        # one job per CPU (an explicit count: some git releases abort on --jobs 0)
+        local jobs
+        jobs=$(getconf _NPROCESSORS_ONLN 2>/dev/null || echo 4)
         
-        # Initialize and update submodules
-        git submodule update --init --recursive
+        # Blobless clones (--filter=blob:none, git 2.36+) still fetch every
+        # commit and tree but only the file contents of the checked out
+        # commit, skipping the historical blobs of the large demo repositories
+        local git_major git_minor
+        IFS=. read -r git_major git_minor _ <<< "$(git --version | awk '{print $3}')"
+        if (( git_major > 2 || (git_major == 2 && git_minor >= 36) )); then
+            git -C "$SCRIPT_DIR" submodule update --init --recursive --jobs "$jobs" --filter=blob:none
+        else
+            log_info "git $git_major.$git_minor does not support blobless submodule clones, using a full clone"
+            git -C "$SCRIPT_DIR" submodule update --init --recursive --jobs "$jobs"
+        fi
         
         log_success "Submodules initialized"
     else
@@ -315,8 +327,9 @@ verify_setup() {
     
     log_step "Verifying setup..."
     
-    # Use the build system verify command
-    if python3 "$SCRIPT_DIR/godot-ci-build-system/build.py" verify --godot-version "$godot_version" --verbose; then
+    # Use the build system verify command (from the repo root, where
+    # build_config.json resolves its relative paths)
+    if (cd "$SCRIPT_DIR" && python3 godot-ci-build-system/build.py verify --godot-version "$godot_version" --verbose); then
         log_success "Setup verification passed! 🎉"
         return 0
     else